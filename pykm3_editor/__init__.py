@@ -1,3 +1,4 @@
 __version__ = "0.0.1"
 
-from .save_reader import SaveReader
\ No newline at end of file
+from .save_reader import SaveReader
+from .save_writer import SaveWriter, transfer_pokemon
\ No newline at end of file
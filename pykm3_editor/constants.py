@@ -1,5 +1,15 @@
 # 0 RS, 1 FRLG, 2 EMERALD
 GAME_NAMES = {0: 'ruby-sapphire', 1: 'firered-leafgreen', 2: 'emerald'}
+PARTY_SIZE = 6
+PARTY_PK_LEN = 100
+BOX_COUNT = 14
+BOX_SLOTS = 30
+BOX_PK_LEN = 80
+BOX_LEN = BOX_SLOTS * BOX_PK_LEN
+# Sections holding the PC buffer, and how many bytes of each belong to it
+PC_BUFFER_SECTIONS = [5, 6, 7, 8, 9, 10, 11, 12, 13]
+PC_SECTION_SIZES = [3968, 3968, 3968, 3968, 3968, 3968, 3968, 3968, 2000]
+
 GAME_OFFSETS = {
     # Trainer Info
     'player_name':   {0: (0x0000, 7),   1: (0x0000, 7),   2: (0x0000, 7)},
@@ -0,0 +1,208 @@
+from typing import Sequence
+
+from .section_reader import SectionReader
+from .constants import (
+    GAME_OFFSETS,
+    PARTY_SIZE,
+    PARTY_PK_LEN,
+    BOX_COUNT,
+    BOX_SLOTS,
+    BOX_PK_LEN,
+    PC_BUFFER_SECTIONS,
+    PC_SECTION_SIZES
+)
+from .utils import (
+    clip,
+    bytes_to_int,
+    int_to_bytes
+)
+
+
+class SaveWriter:
+    def __init__(self, data: bytes):
+        """
+        Edits Pokémon records of a save file without decoding them.
+
+        Sections are only copied into a ``bytearray`` the first time they are
+        written to (copy-on-write), and only those sections get their checksum
+        recomputed when the save is serialized back with ``to_bytes``.
+
+        Args:
+            data (bytes): The raw content of the save file.
+        """
+        self.data = data
+        self.section_reader = SectionReader(data)
+        self.sections = self.section_reader.sections
+        self.game_code = self.get_game_code()
+        self.buffers: dict[int, bytearray] = {}
+
+    @classmethod
+    def from_file(cls, file_path: str):
+        """Creates an instance of SaveWriter by reading content from a file."""
+        with open(file_path, 'rb') as f:
+            content = f.read()
+        return cls(content)
+
+    @classmethod
+    def from_data(cls, data: bytes):
+        """Creates an instance of SaveWriter from a given bytes."""
+        return cls(data)
+
+    def get_game_code(self) -> int:
+        """Same lookup as TrainerInfoSection, without touching the shared class state."""
+        offset, size = GAME_OFFSETS['game_code'][0]
+        return clip(bytes_to_int(self.sections[0].data[offset:offset+size]), 0, 2)
+
+    def read_section(self, section_id: int, offset: int, size: int) -> bytes:
+        section = self.buffers.get(section_id)
+        if section is None:
+            section = self.sections[section_id].data
+        return bytes(section[offset:offset+size])
+
+    def write_section(self, section_id: int, offset: int, data: bytes):
+        if section_id not in self.buffers:
+            self.buffers[section_id] = bytearray(self.sections[section_id].data)
+        self.buffers[section_id][offset:offset+len(data)] = data
+
+    def pc_chunks(self, offset: int, size: int):
+        """Splits a PC buffer range into (section_id, section_offset, start, end) chunks."""
+        start = 0
+        for section_id, section_size in zip(PC_BUFFER_SECTIONS, PC_SECTION_SIZES):
+            if offset < section_size:
+                length = min(size - start, section_size - offset)
+                yield section_id, offset, start, start + length
+                start += length
+                if start == size:
+                    return
+                offset = 0
+            else:
+                offset -= section_size
+        raise ValueError('Offset out of the PC buffer range.')
+
+    def read_pc(self, offset: int, size: int) -> bytes:
+        return b''.join(self.read_section(section_id, section_offset, end - start)
+                        for section_id, section_offset, start, end in self.pc_chunks(offset, size))
+
+    def write_pc(self, offset: int, data: bytes):
+        for section_id, section_offset, start, end in self.pc_chunks(offset, len(data)):
+            self.write_section(section_id, section_offset, data[start:end])
+
+    def box_offset(self, box: int, slot: int) -> int:
+        if not (0 <= box < BOX_COUNT and 0 <= slot < BOX_SLOTS):
+            raise ValueError(f'Box slot ({box}, {slot}) out of range.')
+        offset, _ = GAME_OFFSETS['pc_boxes_pokemon_list'][self.game_code]
+        return offset + (box * BOX_SLOTS + slot) * BOX_PK_LEN
+
+    def read_box_pokemon(self, box: int, slot: int) -> bytes:
+        return self.read_pc(self.box_offset(box, slot), BOX_PK_LEN)
+
+    def write_box_pokemon(self, box: int, slot: int, data: bytes):
+        if len(data) != BOX_PK_LEN:
+            raise ValueError(f'PC Pokémon must be {BOX_PK_LEN} bytes long, got {len(data)}.')
+        self.write_pc(self.box_offset(box, slot), data)
+
+    def clear_box_pokemon(self, box: int, slot: int):
+        self.write_box_pokemon(box, slot, bytes(BOX_PK_LEN))
+
+    def free_box_slots(self) -> list[tuple[int, int]]:
+        """Scans the PC boxes for empty slots, an empty slot has a personality value of 0."""
+        free_slots = []
+        for box in range(BOX_COUNT):
+            for slot in range(BOX_SLOTS):
+                if bytes_to_int(self.read_pc(self.box_offset(box, slot), 4)) == 0:
+                    free_slots.append((box, slot))
+        return free_slots
+
+    @property
+    def team_size(self) -> int:
+        offset, size = GAME_OFFSETS['team_size'][self.game_code]
+        team_size = bytes_to_int(self.read_section(1, offset, size))
+        if team_size > PARTY_SIZE:
+            raise ValueError(f'Corrupted team size {team_size}, the party holds at most {PARTY_SIZE} Pokémon.')
+        return team_size
+
+    def read_party_pokemon(self, slot: int) -> bytes:
+        if not 0 <= slot < self.team_size:
+            raise ValueError(f'Party slot {slot} is empty.')
+        offset, _ = GAME_OFFSETS['team_pokemon_list'][self.game_code]
+        return self.read_section(1, offset + slot * PARTY_PK_LEN, PARTY_PK_LEN)
+
+    def remove_party_pokemon(self, slots: Sequence[int]):
+        """Removes the given party slots, shifting the remaining Pokémon to the front."""
+        kept = [self.read_party_pokemon(i) for i in range(self.team_size) if i not in slots]
+        if not kept:
+            raise ValueError('The party must keep at least one Pokémon.')
+        offset, size = GAME_OFFSETS['team_pokemon_list'][self.game_code]
+        party = b''.join(kept).ljust(size, b'\x00')
+        self.write_section(1, offset, party)
+        offset, size = GAME_OFFSETS['team_size'][self.game_code]
+        self.write_section(1, offset, int_to_bytes(len(kept), size))
+
+    def to_bytes(self) -> bytes:
+        """Returns the save content, with checksums recomputed for the modified sections only."""
+        data = bytearray(self.data)
+        for section_id, section in self.buffers.items():
+            offset = self.sections[section_id].offset
+            checksum = SectionReader.calculate_checksum(section, SectionReader.SECTION_DATA_SIZE)
+            data[offset:offset+len(section)] = section
+            data[offset+0x0FF6:offset+0x0FF6+2] = int_to_bytes(checksum, 2)
+        return bytes(data)
+
+    def save(self, file_path: str):
+        with open(file_path, 'wb') as f:
+            f.write(self.to_bytes())
+
+
+def transfer_pokemon(source: SaveWriter, target: SaveWriter,
+                     party_slots: Sequence[int] = (), box_slots: Sequence[tuple[int, int]] = (),
+                     move: bool = False) -> list[tuple[int, int]]:
+    """
+    Copies or moves Pokémon from ``source`` into the free PC box slots of ``target``.
+
+    The records are transferred as raw encrypted bytes: the encryption key and the
+    substructure order only depend on the OT ID and personality value stored in the
+    record itself, so nothing has to be decoded. Party Pokémon are stored in the PC
+    without their 20 bytes of battle stats, which the game recomputes on withdrawal.
+    ``source`` and ``target`` can be the same SaveWriter to move Pokémon within a save.
+
+    Args:
+        source (SaveWriter): The save the Pokémon are read from.
+        target (SaveWriter): The save the Pokémon are written to.
+        party_slots (Sequence[int]): Party slots of ``source`` to transfer.
+        box_slots (Sequence[tuple[int, int]]): (box, slot) pairs of ``source`` to transfer.
+        move (bool): Removes the Pokémon from ``source`` when True.
+
+    Returns:
+        list[tuple[int, int]]: The (box, slot) pairs of ``target`` that were filled, in order.
+
+    Raises:
+        ValueError: If a source slot is empty or listed twice, if a move would empty the
+            party of ``source``, or if ``target`` does not have enough free slots.
+    """
+    if len(set(party_slots)) != len(party_slots) or len(set(box_slots)) != len(box_slots):
+        raise ValueError('Source slots must not be listed twice.')
+    if move and party_slots and len(party_slots) >= source.team_size:
+        raise ValueError('The party must keep at least one Pokémon.')
+
+    records = [source.read_party_pokemon(slot)[:BOX_PK_LEN] for slot in party_slots]
+    for box, slot in box_slots:
+        record = source.read_box_pokemon(box, slot)
+        if bytes_to_int(record[:4]) == 0:
+            raise ValueError(f'Box slot ({box}, {slot}) is empty.')
+        records.append(record)
+
+    # Slots freed by a move within the same save are not reused
+    free_slots = target.free_box_slots()
+    if len(records) > len(free_slots):
+        raise ValueError(f'Not enough free box slots: {len(records)} needed, {len(free_slots)} available.')
+
+    if move:
+        if party_slots:
+            source.remove_party_pokemon(party_slots)
+        for box, slot in box_slots:
+            source.clear_box_pokemon(box, slot)
+
+    filled_slots = free_slots[:len(records)]
+    for (box, slot), record in zip(filled_slots, records):
+        target.write_box_pokemon(box, slot, record)
+    return filled_slots
@@ -6,7 +6,14 @@ from .pokemon_parser import BasePokemon
 from .item_parser import Item
 from .constants import (
     GAME_NAMES,
-    GAME_OFFSETS
+    GAME_OFFSETS,
+    PARTY_SIZE,
+    PARTY_PK_LEN,
+    BOX_COUNT,
+    BOX_PK_LEN,
+    BOX_LEN,
+    PC_BUFFER_SECTIONS,
+    PC_SECTION_SIZES
 )
 from .utils import (
     clip,
@@ -44,7 +51,9 @@ class TrainerInfoSection(BaseSection):
     def __init__(self, data):
         super().__init__()
         self.data = data
-        self.get_game_code(self.get_data('game_code'))
+        # Not get_data: it would use the game code of the previously parsed save
+        offset, size = self.offsets['game_code'][0]
+        self.get_game_code(self.data[offset:offset+size])
         self.get_security_key(self.get_data('security_key'))
         self.player_name = bytes_to_str(self.get_data('player_name'))
         self.player_gender = bytes_to_int(self.get_data('player_gender'))
@@ -101,8 +110,8 @@ class TeamItemsSection(BaseSection):
     def get_pokemon_list(self) -> list:
         data = self.get_data('team_pokemon_list')
         pokemon_list = []
-        for i in range(0, 600, 100):
-            pokemon = BasePokemon.from_bytes(data[0+i:0+i + 100])
+        for i in range(0, PARTY_SIZE * PARTY_PK_LEN, PARTY_PK_LEN):
+            pokemon = BasePokemon.from_bytes(data[0+i:0+i + PARTY_PK_LEN])
             pokemon_list.append(pokemon)
         return pokemon_list
 
@@ -167,7 +176,7 @@ class PCBufferSection(BaseSection):
         self.pc_boxes_pokemon_list = self.get_pc_pokemons(self.get_data('pc_boxes_pokemon_list'))
 
     def get_box_names(self, data: bytes) -> list[str]:
-        box_length = len(data) // 14
+        box_length = len(data) // BOX_COUNT
         box_names = []
         for i in range(0, len(data), box_length):
             box_name = bytes_to_str(data[0+i:0+i+box_length])
@@ -183,10 +192,10 @@ class PCBufferSection(BaseSection):
 
     def get_pc_pokemons(self, data: bytes) -> dict:
         pc_data = {}
-        box_len = 2400
-        pk_len = 80
+        box_len = BOX_LEN
+        pk_len = BOX_PK_LEN
 
-        for i in range(14):
+        for i in range(BOX_COUNT):
             pc_data[f"Box {i}"] = {
                 "Box Name": self.box_names[i],
                 "Box Wallpaper": self.box_wallpapers[i],
@@ -217,6 +226,7 @@ class SaveSection:
     checksum: int
     signature: int
     save_index: int
+    offset: int = 0
 
     def to_dict(self):
         return asdict(self)
@@ -244,12 +254,10 @@ class SectionReader:
 
     def get_full_pc_buffer(self) -> bytes:
         """ Joins all PC buffer sections into one continuous data block. """
-        pc_buffer_sections = [5, 6, 7, 8, 9, 10, 11, 12, 13]
-        section_sizes = [3968, 3968, 3968, 3968, 3968, 3968, 3968, 3968, 2000]
         pc_data = bytearray()
-        for i, section_id in enumerate(pc_buffer_sections):
+        for i, section_id in enumerate(PC_BUFFER_SECTIONS):
             if section_id in self.sections:
-                pc_data.extend(self.sections[section_id].data[0:section_sizes[i]])
+                pc_data.extend(self.sections[section_id].data[0:PC_SECTION_SIZES[i]])
             else:
                 raise ValueError(f"Section {section_id} is missing.")
         return bytes(pc_data)
@@ -280,14 +288,15 @@ class SectionReader:
         checksum = bytes_to_int(section_data[0x0FF6:0x0FF6 + 2])
         signature = bytes_to_int(section_data[0x0FF8:0x0FF8 + 4])
         save_index = bytes_to_int(section_data[0x0FFC:0x0FFC + 4])
-        return SaveSection(section_id, data, checksum, signature, save_index)
+        return SaveSection(section_id, data, checksum, signature, save_index, offset)
 
     def validate_section(self, section: SaveSection) -> bool:
         if section.signature != self.SIGNATURE:
             return False
         return self.calculate_checksum(section.data, self.SECTION_DATA_SIZE) == section.checksum
 
-    def calculate_checksum(self, d: bytes, s: int) -> int:
+    @staticmethod
+    def calculate_checksum(d: bytes, s: int) -> int:
         checksum = sum(struct.unpack("<" + "I" * (s // 4), d[:s - (s % 4)]))
         return ((checksum >> 16) + (checksum & 0xFFFF)) & 0xFFFF
 
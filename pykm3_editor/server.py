@@ -0,0 +1,205 @@
+import argparse
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from dataclasses import asdict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse
+
+from .save_reader import SaveReader
+
+ITEM_POCKETS = ['pc_items', 'item_pocket', 'key_item_pocket', 'ball_item_pocket', 'tm_case', 'berry_pocket']
+
+
+class SaveCache:
+    def __init__(self, max_saves: int = 32):
+        """
+        Size-bounded LRU of parsed saves, keyed by the SHA-256 of the save file.
+
+        Every section is parsed once when a save is added, since the section
+        and Pokémon parsers keep the security key, game code and encryption key
+        as class attributes: parsing lazily would mix up saves loaded in between.
+        For the same reason the parsing is serialized behind ``parse_lock``, while
+        ``lock`` only guards the cache itself so lookups never wait for a parse.
+
+        Args:
+            max_saves (int): The number of saves kept in memory before the least
+                recently used one is evicted.
+        """
+        if max_saves < 1:
+            raise ValueError('max_saves must be at least 1')
+        self.max_saves = max_saves
+        self.saves: OrderedDict[str, dict] = OrderedDict()
+        self.lock = threading.Lock()
+        self.parse_lock = threading.Lock()
+
+    def load_file(self, file_path: str) -> str:
+        with open(file_path, 'rb') as f:
+            content = f.read()
+        return self.load_data(content)
+
+    def load_data(self, data: bytes) -> str:
+        """Parses the save unless it is already cached, and returns its id."""
+        save_id = hashlib.sha256(data).hexdigest()
+        if self.get(save_id) is not None:
+            return save_id
+        with self.parse_lock:
+            # The same save may have been parsed while waiting for the lock
+            if self.get(save_id) is not None:
+                return save_id
+            save = self.parse_save(SaveReader.from_data(data))
+            with self.lock:
+                self.saves[save_id] = save
+                if len(self.saves) > self.max_saves:
+                    self.saves.popitem(last=False)
+        return save_id
+
+    def get(self, save_id: str) -> dict | None:
+        with self.lock:
+            save = self.saves.get(save_id)
+            if save is not None:
+                self.saves.move_to_end(save_id)
+            return save
+
+    @staticmethod
+    def parse_save(reader: SaveReader) -> dict:
+        trainer_info = reader.trainer_info
+        team_items = reader.team_items
+        pc_buffer = reader.pc_buffer
+        game_specific_data = reader.game_specific_data
+
+        trainer = {
+            'game_name': trainer_info.game_name,
+            'player_name': trainer_info.player_name,
+            'player_gender': trainer_info.player_gender,
+            'trainer_id': trainer_info.trainer_id,
+            'tid_secret': trainer_info.tid_secret,
+            'time_played': trainer_info.time_played,
+            'options': trainer_info.options,
+            'money': team_items.money,
+            'coins': team_items.coins,
+            'rival_name': game_specific_data.rival_name,
+        }
+        party = [asdict(pokemon) for pokemon in team_items.team_pokemon_list[:team_items.team_size]]
+        boxes = []
+        for box in pc_buffer.pc_boxes_pokemon_list.values():
+            boxes.append({
+                'name': box['Box Name'],
+                'wallpaper': box['Box Wallpaper'],
+                'pokemon': [dict(slot=i, **asdict(pokemon)) for i, pokemon in enumerate(box['Pokemons'])
+                            if pokemon.personality_value != 0],
+            })
+        items = {
+            pocket: [asdict(item) for item in getattr(team_items, pocket) if item.item_id != 0]
+            for pocket in ITEM_POCKETS
+        }
+        return {
+            'trainer': trainer,
+            'party': party,
+            'boxes': boxes,
+            'current_box': pc_buffer.current_pc_box,
+            'items': items,
+        }
+
+
+class SaveRequestHandler(BaseHTTPRequestHandler):
+    """
+    JSON API over a SaveCache:
+
+        POST /saves                          {"path": "..."} loads a save from disk
+        POST /saves/upload                   raw save bytes as the request body
+        GET  /saves/<id>/trainer
+        GET  /saves/<id>/party
+        GET  /saves/<id>/boxes[/<box>]
+        GET  /saves/<id>/items[/<pocket>]
+    """
+    cache: SaveCache = None
+
+    def do_POST(self):
+        parts = self.get_path_parts()
+        if 'Content-Length' not in self.headers:
+            return self.send_json({'error': 'Content-Length required'}, 411)
+        try:
+            length = int(self.headers['Content-Length'])
+            if length < 0:
+                raise ValueError(length)
+        except ValueError:
+            return self.send_json({'error': 'Invalid Content-Length'}, 400)
+
+        body = self.rfile.read(length)
+        try:
+            if parts == ['saves']:
+                path = json.loads(body)['path']
+                # open() would also accept an int, as a file descriptor of this process
+                if not isinstance(path, str):
+                    raise TypeError('path must be a string')
+                save_id = self.cache.load_file(path)
+            elif parts == ['saves', 'upload']:
+                save_id = self.cache.load_data(body)
+            else:
+                return self.send_json({'error': 'Not found'}, 404)
+        except (OSError, KeyError, IndexError, TypeError, ValueError) as e:
+            return self.send_json({'error': f'Could not load save: {e!r}'}, 400)
+        self.send_json({'id': save_id}, 201)
+
+    def do_GET(self):
+        parts = self.get_path_parts()
+        if len(parts) < 3 or parts[0] != 'saves':
+            return self.send_json({'error': 'Not found'}, 404)
+        save = self.cache.get(parts[1])
+        if save is None:
+            return self.send_json({'error': f'Save {parts[1]} not loaded'}, 404)
+
+        match parts[2:]:
+            case ['trainer']:
+                self.send_json(save['trainer'])
+            case ['party']:
+                self.send_json(save['party'])
+            case ['boxes']:
+                self.send_json({'current_box': save['current_box'], 'boxes': save['boxes']})
+            case ['boxes', box] if box.isascii() and box.isdecimal() and int(box) < len(save['boxes']):
+                self.send_json(save['boxes'][int(box)])
+            case ['items']:
+                self.send_json(save['items'])
+            case ['items', pocket] if pocket in save['items']:
+                self.send_json(save['items'][pocket])
+            case _:
+                self.send_json({'error': 'Not found'}, 404)
+
+    def get_path_parts(self) -> list[str]:
+        return [p for p in urlparse(self.path).path.split('/') if p]
+
+    def send_json(self, data, status: int = 200):
+        content = json.dumps(data, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+
+def make_server(port: int = 8000, max_saves: int = 32) -> ThreadingHTTPServer:
+    """Creates a server listening on localhost only, with its own SaveCache."""
+    handler = type('SaveRequestHandler', (SaveRequestHandler,), {'cache': SaveCache(max_saves)})
+    return ThreadingHTTPServer(('127.0.0.1', port), handler)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Serves parsed save files as JSON on localhost.')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--max-saves', type=int, default=32)
+    args = parser.parse_args()
+
+    server = make_server(args.port, args.max_saves)
+    print(f'Serving on http://127.0.0.1:{args.port}')
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,63 @@
+import struct
+
+from pykm3_editor.section_reader import SectionReader
+from pykm3_editor.constants import (
+    GAME_OFFSETS,
+    PARTY_PK_LEN,
+    BOX_SLOTS,
+    BOX_PK_LEN,
+    PC_BUFFER_SECTIONS,
+    PC_SECTION_SIZES
+)
+
+# Value stored at 0x00AC of the trainer info: the game code for RS and FRLG,
+# the security key for Emerald
+GAME_CODE_VALUES = {0: 0, 1: 1, 2: 0x1234ABCD}
+
+
+def write(section: bytearray, key: str, game_code: int, value: int):
+    offset, size = GAME_OFFSETS[key][game_code]
+    section[offset:offset+size] = value.to_bytes(size, 'little')
+
+
+def pokemon_record(personality: int, size: int = BOX_PK_LEN) -> bytes:
+    """A Pokémon record with a distinct personality value, nickname 'ABC' and zeroed data."""
+    record = bytearray(size)
+    record[0:4] = personality.to_bytes(4, 'little')
+    record[4:8] = (54321).to_bytes(4, 'little')
+    record[8:18] = bytes([0xBB, 0xBC, 0xBD] + [0xFF] * 7)
+    return bytes(record)
+
+
+def build_save(game_code: int = 1, party: list[bytes] = (), boxes: dict = None,
+               money: int = 0, save_index: int = 5) -> bytes:
+    """Builds a 128KB save with both slots holding the same valid sections."""
+    sections = {i: bytearray(SectionReader.SECTION_DATA_SIZE) for i in range(14)}
+    write(sections[0], 'game_code', 0, GAME_CODE_VALUES[game_code])
+    security_key = GAME_CODE_VALUES[game_code] if game_code == 2 else 0
+
+    write(sections[1], 'team_size', game_code, len(party))
+    offset, _ = GAME_OFFSETS['team_pokemon_list'][game_code]
+    for i, record in enumerate(party):
+        sections[1][offset+i*PARTY_PK_LEN:offset+(i+1)*PARTY_PK_LEN] = record
+    write(sections[1], 'money', game_code, money ^ security_key)
+
+    pc_buffer = bytearray(sum(PC_SECTION_SIZES))
+    offset, _ = GAME_OFFSETS['pc_boxes_pokemon_list'][game_code]
+    for (box, slot), record in (boxes or {}).items():
+        start = offset + (box * BOX_SLOTS + slot) * BOX_PK_LEN
+        pc_buffer[start:start+BOX_PK_LEN] = record
+    start = 0
+    for section_id, size in zip(PC_BUFFER_SECTIONS, PC_SECTION_SIZES):
+        sections[section_id][:size] = pc_buffer[start:start+size]
+        start += size
+
+    data = bytearray(0x20000)
+    for base in (SectionReader.SAVE_A_OFFSET[0], SectionReader.SAVE_B_OFFSET[0]):
+        for section_id, section in sections.items():
+            offset = base + section_id * SectionReader.SECTION_SIZE
+            checksum = SectionReader.calculate_checksum(bytes(section), SectionReader.SECTION_DATA_SIZE)
+            data[offset:offset+len(section)] = section
+            struct.pack_into('<HHII', data, offset + 0x0FF4, section_id, checksum,
+                             SectionReader.SIGNATURE, save_index)
+    return bytes(data)
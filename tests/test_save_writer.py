@@ -0,0 +1,82 @@
+import pytest
+
+from pykm3_editor import SaveWriter, transfer_pokemon
+from pykm3_editor.section_reader import SectionReader
+from pykm3_editor.constants import PARTY_PK_LEN, BOX_PK_LEN, PC_SECTION_SIZES
+
+from synthetic_save import build_save, pokemon_record
+
+
+def party(count: int) -> list[bytes]:
+    return [pokemon_record(i + 1, PARTY_PK_LEN) for i in range(count)]
+
+
+def test_transfer_between_saves_reparses():
+    source = SaveWriter(build_save(party=party(4), boxes={(0, 0): pokemon_record(77)}))
+    target = SaveWriter(build_save(boxes={(0, 0): pokemon_record(50)}))
+
+    filled = transfer_pokemon(source, target, party_slots=[1, 3], box_slots=[(0, 0)], move=True)
+
+    assert filled == [(0, 1), (0, 2), (0, 3)]
+    assert target.read_box_pokemon(0, 1) == pokemon_record(2)
+    assert target.read_box_pokemon(0, 3) == pokemon_record(77)
+    assert source.team_size == 2
+    assert source.read_party_pokemon(1) == pokemon_record(3, PARTY_PK_LEN)
+    assert source.read_box_pokemon(0, 0) == bytes(BOX_PK_LEN)
+
+    for writer in (source, target):
+        reader = SectionReader(writer.to_bytes())
+        assert len(reader.sections) == 14
+        assert reader.get_full_pc_buffer() == writer.read_pc(0, sum(PC_SECTION_SIZES))
+
+
+def test_only_touched_sections_are_buffered():
+    source = SaveWriter(build_save(party=party(2)))
+    target = SaveWriter(build_save())
+
+    transfer_pokemon(source, target, party_slots=[0], move=True)
+
+    assert sorted(source.buffers) == [1]
+    assert sorted(target.buffers) == [5]
+
+
+def test_record_spanning_two_sections():
+    writer = SaveWriter(build_save())
+    record = pokemon_record(9)
+    # Box 1 slot 19 starts at 3924 in the PC buffer, section 5 ends at 3968
+    writer.write_box_pokemon(1, 19, record)
+
+    assert sorted(writer.buffers) == [5, 6]
+    assert writer.read_box_pokemon(1, 19) == record
+    pc_buffer = SectionReader(writer.to_bytes()).get_full_pc_buffer()
+    assert pc_buffer[3924:3924+BOX_PK_LEN] == record
+
+
+def test_duplicate_slots_are_rejected():
+    writer = SaveWriter(build_save(party=party(3), boxes={(0, 0): pokemon_record(77)}))
+
+    with pytest.raises(ValueError):
+        transfer_pokemon(writer, writer, box_slots=[(0, 0), (0, 0)], move=True)
+    with pytest.raises(ValueError):
+        transfer_pokemon(writer, writer, party_slots=[0, 0], move=True)
+    assert writer.buffers == {}
+
+
+def test_move_cannot_empty_the_party():
+    writer = SaveWriter(build_save(party=party(2)))
+
+    with pytest.raises(ValueError):
+        transfer_pokemon(writer, writer, party_slots=[0, 1], move=True)
+    assert writer.buffers == {}
+    assert transfer_pokemon(writer, writer, party_slots=[0, 1]) == [(0, 0), (0, 1)]
+
+
+def test_corrupted_team_size_is_rejected():
+    writer = SaveWriter(build_save(party=party(2)))
+    # team_size of FRLG is at 0x0034 of section 1
+    writer.write_section(1, 0x34, (9).to_bytes(4, 'little'))
+
+    with pytest.raises(ValueError):
+        writer.read_party_pokemon(7)
+    with pytest.raises(ValueError):
+        transfer_pokemon(writer, writer, party_slots=[0])
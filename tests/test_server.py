@@ -0,0 +1,169 @@
+import json
+import os
+import socket
+import threading
+import urllib.error
+import urllib.request
+
+import pytest
+
+from pykm3_editor.server import SaveCache, make_server
+from pykm3_editor.constants import PARTY_PK_LEN
+
+from synthetic_save import build_save, pokemon_record
+
+
+@pytest.fixture
+def server():
+    server = make_server(0, max_saves=2)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def request(server, path: str, body: bytes = None) -> tuple[int, object]:
+    url = f'http://127.0.0.1:{server.server_address[1]}{path}'
+    req = urllib.request.Request(url, data=body, method='GET' if body is None else 'POST')
+    try:
+        with urllib.request.urlopen(req, timeout=10) as response:
+            return response.status, json.loads(response.read())
+    except urllib.error.HTTPError as e:
+        return e.code, json.loads(e.read())
+
+
+def raw_request(server, request: bytes) -> bytes:
+    with socket.create_connection(server.server_address, timeout=10) as sock:
+        sock.sendall(request)
+        response = b''
+        while chunk := sock.recv(4096):
+            response += chunk
+    return response
+
+
+def test_upload_and_queries(server):
+    data = build_save(party=[pokemon_record(11, PARTY_PK_LEN)], boxes={(1, 4): pokemon_record(22)}, money=1234)
+    status, body = request(server, '/saves/upload', data)
+    assert status == 201
+    save_id = body['id']
+
+    status, trainer = request(server, f'/saves/{save_id}/trainer')
+    assert status == 200
+    assert trainer['game_name'] == 'firered-leafgreen'
+    assert trainer['money'] == 1234
+
+    status, party = request(server, f'/saves/{save_id}/party')
+    assert [(p['personality_value'], p['nickname']) for p in party] == [(11, 'ABC')]
+
+    status, boxes = request(server, f'/saves/{save_id}/boxes')
+    assert len(boxes['boxes']) == 14
+    assert [p['slot'] for p in boxes['boxes'][1]['pokemon']] == [4]
+    assert request(server, f'/saves/{save_id}/boxes/1')[1] == boxes['boxes'][1]
+    assert request(server, f'/saves/{save_id}/boxes/14')[0] == 404
+
+    status, items = request(server, f'/saves/{save_id}/items')
+    assert status == 200
+    assert items['item_pocket'] == []
+
+
+def test_lru_eviction(server):
+    ids = [request(server, '/saves/upload', build_save(money=i))[1]['id'] for i in range(2)]
+    # Touching the first save makes the second one the least recently used
+    assert request(server, f'/saves/{ids[0]}/trainer')[0] == 200
+    request(server, '/saves/upload', build_save(money=2))
+
+    assert request(server, f'/saves/{ids[0]}/trainer')[0] == 200
+    assert request(server, f'/saves/{ids[1]}/trainer')[0] == 404
+
+
+def test_bad_requests(server):
+    assert request(server, '/saves', b'not json')[0] == 400
+    assert request(server, '/saves', b'{}')[0] == 400
+    # An int path must not be opened as a file descriptor of the server
+    read_fd, write_fd = os.pipe()
+    os.close(write_fd)
+    try:
+        assert request(server, '/saves', json.dumps({'path': read_fd}).encode())[0] == 400
+        os.fstat(read_fd)
+    finally:
+        os.close(read_fd)
+    assert request(server, '/saves', b'{"path": "/does/not/exist.sav"}')[0] == 400
+    assert request(server, '/saves/upload', b'\x00' * 16)[0] == 400
+    # The server is still serving
+    assert request(server, '/saves/upload', build_save())[0] == 201
+
+
+def test_game_detected_after_emerald_save():
+    cache = SaveCache()
+    emerald = cache.get(cache.load_data(build_save(game_code=2, party=[pokemon_record(1, PARTY_PK_LEN)], money=500)))
+    firered = cache.get(cache.load_data(build_save(game_code=1, party=[pokemon_record(2, PARTY_PK_LEN)])))
+    other_emerald = cache.get(cache.load_data(build_save(game_code=2, money=700, save_index=6)))
+
+    assert (emerald['trainer']['game_name'], emerald['trainer']['money']) == ('emerald', 500)
+    assert firered['trainer']['game_name'] == 'firered-leafgreen'
+    assert [p['personality_value'] for p in firered['party']] == [2]
+    assert (other_emerald['trainer']['game_name'], other_emerald['trainer']['money']) == ('emerald', 700)
+
+
+@pytest.mark.parametrize('content_length, status', [
+    (None, b'411'), (b'abc', b'400'), (b'-1', b'400'),
+])
+def test_bad_content_length(server, content_length, status):
+    header = b'' if content_length is None else b'Content-Length: ' + content_length + b'\r\n'
+    response = raw_request(server, b'POST /saves/upload HTTP/1.0\r\n' + header + b'\r\n')
+    assert response.split(b' ')[1] == status
+
+
+def test_non_ascii_box_index(server):
+    save_id = request(server, '/saves/upload', build_save())[1]['id']
+    # 0xB2 is decoded as '²' (superscript two), a digit that int() rejects
+    response = raw_request(server, f'GET /saves/{save_id}/boxes/'.encode() + b'\xb2 HTTP/1.0\r\n\r\n')
+    assert response.split(b' ')[1] == b'404'
+
+
+def test_lookups_do_not_wait_for_parsing(monkeypatch):
+    cache = SaveCache()
+    save_id = cache.load_data(build_save(money=1))
+    parsing, release = threading.Event(), threading.Event()
+    parse_save = SaveCache.parse_save
+
+    def slow_parse_save(reader):
+        parsing.set()
+        release.wait(10)
+        return parse_save(reader)
+
+    monkeypatch.setattr(SaveCache, 'parse_save', staticmethod(slow_parse_save))
+    loader = threading.Thread(target=cache.load_data, args=(build_save(money=2),))
+    loader.start()
+    try:
+        assert parsing.wait(10)
+        lookup = threading.Thread(target=cache.get, args=(save_id,))
+        lookup.start()
+        lookup.join(1)
+        assert not lookup.is_alive()
+    finally:
+        release.set()
+        loader.join()
+    assert len(cache.saves) == 2
+
+
+def test_concurrent_loads_parse_once(monkeypatch):
+    cache = SaveCache()
+    calls = []
+    parse_save = SaveCache.parse_save
+
+    def counting_parse_save(reader):
+        calls.append(reader)
+        return parse_save(reader)
+
+    monkeypatch.setattr(SaveCache, 'parse_save', staticmethod(counting_parse_save))
+    data = build_save()
+    threads = [threading.Thread(target=cache.load_data, args=(data,)) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert len(cache.saves) == 1